@@ -1,5 +1,10 @@
 import cmath
-from typing import List, Dict
+import math
+from array import array
+from typing import List, Dict, Optional
+from src.precision import (
+    validar_precision, tolerancia, empaquetar, desempaquetar, empaquetar_reales
+)
 
 class EstadoCuantico:
     """
@@ -9,16 +14,19 @@ class EstadoCuantico:
         id (str): Identificador único del estado.
         vector (List[complex]): Vector de amplitudes del estado.
         base (str): Base en la que está expresado el vector (ej. "computacional").
+        precision (str): Precisión numérica de las amplitudes ("complex64" o "complex128").
     """
 
-    def __init__(self, id: str, vector: List[complex], base: str):
+    def __init__(self, id: str, vector: List[complex], base: str, precision: Optional[str] = None):
         if not vector:
             raise ValueError("El vector de estado no puede estar vacío.")
         self._id = id
-        # Asegurarse de que todas las componentes son complejas
-        self._vector = [complex(amp) for amp in vector]
+        self._precision = validar_precision(precision)
+        # Se normaliza en doble precisión y solo después se empaqueta [re, im, ...]
+        # con la precisión elegida, para no perder rango ni redondear dos veces
+        vector = self._normalizar_vector([complex(amp) for amp in vector])
+        self._datos = empaquetar(vector, self._precision)
         self._base = base
-        self._normalizar_vector()
 
     @property
     def id(self) -> str:
@@ -26,18 +34,45 @@ class EstadoCuantico:
 
     @property
     def vector(self) -> List[complex]:
-        return self._vector
+        return desempaquetar(self._datos)
 
     @property
     def base(self) -> str:
         return self._base
 
-    def _normalizar_vector(self, tolerance: float = 1e-9):
-        """Normaliza el vector de estado para que la suma de los módulos al cuadrado sea 1."""
-        norm_squared = sum(abs(amp)**2 for amp in self._vector)
-        if abs(norm_squared - 1.0) > tolerance:
-            norm = cmath.sqrt(norm_squared)
-            self._vector = [amp / norm for amp in self._vector]
+    @property
+    def precision(self) -> str:
+        return self._precision
+
+    @property
+    def datos(self) -> array:
+        """Amplitudes empaquetadas [re0, im0, re1, im1, ...] con la precisión del estado (solo lectura)."""
+        return self._datos
+
+    @property
+    def dim(self) -> int:
+        return len(self._datos) // 2
+
+    def _normalizar_vector(self, vector: List[complex], tolerance: Optional[float] = None) -> List[complex]:
+        """
+        Normaliza el vector de estado para que la suma de los módulos al cuadrado sea 1.
+        Si no se indica tolerancia, se usa la propia de la precisión del estado.
+
+        Excepciones:
+            ValueError: Si el vector tiene norma nula o amplitudes no finitas.
+        """
+        if tolerance is None:
+            tolerance = tolerancia(self._precision)
+        if not all(cmath.isfinite(amp) for amp in vector):
+            raise ValueError("El vector de estado contiene amplitudes no finitas.")
+        # Escalar por la mayor amplitud evita desbordamientos al elevar al cuadrado
+        escala = max(abs(amp) for amp in vector)
+        if escala == 0:
+            raise ValueError("El vector de estado no puede tener norma nula.")
+        norm = escala * math.sqrt(sum(abs(amp / escala)**2 for amp in vector))
+        if abs(norm * norm - 1.0) > tolerance:
+            vector = [amp / norm for amp in vector]
+        return vector
 
     def medir(self) -> Dict[str, float]:
         """
@@ -48,10 +83,15 @@ class EstadoCuantico:
             Dict[str, float]: Un diccionario mapeando el índice del estado base
                               (como string) a su probabilidad.
         """
+        datos = self._datos
+        # La probabilidad es el cuadrado del módulo de la amplitud (re² + im²),
+        # calculada directamente sobre el array empaquetado
+        probs = empaquetar_reales(
+            (datos[k] * datos[k] + datos[k + 1] * datos[k + 1] for k in range(0, len(datos), 2)),
+            self._precision
+        )
         probabilities = {}
-        for i, amplitude in enumerate(self._vector):
-            # La probabilidad es el cuadrado del módulo de la amplitud
-            prob = abs(amplitude)**2
+        for i, prob in enumerate(probs):
             probabilities[str(i)] = prob
         return probabilities
 
@@ -65,4 +105,4 @@ class EstadoCuantico:
         """
         Retorna una representación oficial del estado cuántico.
         """
-        return f"EstadoCuantico(id='{self.id}', vector={self.vector}, base='{self.base}')"
\ No newline at end of file
+        return f"EstadoCuantico(id='{self.id}', vector={self.vector}, base='{self.base}', precision='{self.precision}')"
\ No newline at end of file
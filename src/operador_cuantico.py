@@ -1,6 +1,7 @@
 import cmath
-from typing import List
+from typing import List, Optional
 from src.estado_cuantico import EstadoCuantico
+from src.precision import validar_precision, promover, empaquetar, desempaquetar
 
 class OperadorCuantico:
     """
@@ -9,17 +10,19 @@ class OperadorCuantico:
     Atributos:
         nombre (str): Identificador o etiqueta del operador (ej. "Hadamard", "X").
         matriz (List[List[complex]]): La matriz unitaria que implementa la transformación.
+        precision (str): Precisión numérica de los elementos ("complex64" o "complex128").
     """
 
-    def __init__(self, nombre: str, matriz: List[List[complex]]):
+    def __init__(self, nombre: str, matriz: List[List[complex]], precision: Optional[str] = None):
         if not matriz or not all(matriz[i] for i in range(len(matriz))):
             raise ValueError("La matriz del operador no puede estar vacía.")
         num_rows = len(matriz)
-        num_cols = len(matriz[0])
-        if num_rows != num_cols:
+        if any(len(row) != num_rows for row in matriz):
             raise ValueError("La matriz del operador debe ser cuadrada.")
         self._nombre = nombre
-        self._matriz = [[complex(val) for val in row] for row in matriz]
+        self._precision = validar_precision(precision)
+        # Cada fila se guarda empaquetada [re, im, ...] con la precisión elegida
+        self._filas = [empaquetar(row, self._precision) for row in matriz]
         self._dim = num_rows # Dimensión del operador
 
     @property
@@ -28,17 +31,25 @@ class OperadorCuantico:
 
     @property
     def matriz(self) -> List[List[complex]]:
-        return self._matriz
+        return [desempaquetar(fila) for fila in self._filas]
 
     @property
     def dim(self) -> int:
         return self._dim
 
+    @property
+    def precision(self) -> str:
+        return self._precision
+
     def aplicar(self, estado: EstadoCuantico) -> EstadoCuantico:
         """
         Aplica la transformación lineal del operador a un estado cuántico.
         Devuelve un nuevo objeto EstadoCuantico con el estado transformado.
 
+        La precisión del resultado sigue la regla de promoción: si operador y estado
+        son complex64 el resultado es complex64; cualquier mezcla con complex128
+        produce complex128.
+
         Args:
             estado (EstadoCuantico): El estado cuántico al que se aplicará el operador.
 
@@ -48,17 +59,26 @@ class OperadorCuantico:
         Excepciones:
             ValueError: Si la dimensión del operador no coincide con la del estado.
         """
-        if self.dim != len(estado.vector):
+        if self.dim != estado.dim:
             raise ValueError(
                 f"La dimensión del operador ({self.dim}) no coincide "
-                f"con la dimensión del estado ({len(estado.vector)})."
+                f"con la dimensión del estado ({estado.dim})."
             )
 
+        # Producto matriz-vector directamente sobre los arrays empaquetados [re, im, ...],
+        # sin reconstruir la matriz ni el vector como objetos complex
+        datos = estado.datos
         nuevo_vector: List[complex] = []
-        for i in range(self.dim):
-            new_amplitude = sum(self._matriz[i][j] * estado.vector[j] for j in range(self.dim))
-            nuevo_vector.append(new_amplitude)
+        for fila in self._filas:
+            re = im = 0.0
+            for k in range(0, len(fila), 2):
+                a, b = fila[k], fila[k + 1]
+                c, d = datos[k], datos[k + 1]
+                re += a * c - b * d
+                im += a * d + b * c
+            nuevo_vector.append(complex(re, im))
 
         # Generar un nuevo ID para el estado transformado
         nuevo_id = f"{estado.id}_{self.nombre}"
-        return EstadoCuantico(nuevo_id, nuevo_vector, estado.base)
\ No newline at end of file
+        precision = promover(self.precision, estado.precision)
+        return EstadoCuantico(nuevo_id, nuevo_vector, estado.base, precision)
\ No newline at end of file
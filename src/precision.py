@@ -0,0 +1,81 @@
+from array import array
+from typing import Iterable, List, Optional
+
+# Código de tipo de `array` usado para cada parte (real e imaginaria) de la amplitud.
+_CODIGOS_TIPO = {
+    "complex64": "f",   # 2 x float32
+    "complex128": "d",  # 2 x float64
+}
+
+# Tolerancia de normalización acorde al épsilon de cada precisión.
+_TOLERANCIAS = {
+    "complex64": 1e-6,
+    "complex128": 1e-9,
+}
+
+# Orden de promoción: ante precisiones mezcladas gana la más ancha.
+_RANGO = {
+    "complex64": 0,
+    "complex128": 1,
+}
+
+PRECISION_POR_DEFECTO = "complex128"
+PRECISIONES = tuple(_CODIGOS_TIPO)
+
+
+def validar_precision(precision: Optional[str]) -> str:
+    """
+    Comprueba que la precisión es soportada y la devuelve.
+    None se interpreta como la precisión por defecto.
+
+    Excepciones:
+        ValueError: Si la precisión no es "complex64" ni "complex128".
+    """
+    if precision is None:
+        return PRECISION_POR_DEFECTO
+    if precision not in _CODIGOS_TIPO:
+        raise ValueError(
+            f"Precisión '{precision}' no soportada. Opciones: {', '.join(PRECISIONES)}."
+        )
+    return precision
+
+
+def tolerancia(precision: str) -> float:
+    """Retorna la tolerancia de normalización para la precisión dada."""
+    return _TOLERANCIAS[precision]
+
+
+def promover(*precisiones: str) -> str:
+    """
+    Retorna la precisión resultante de combinar varias precisiones.
+    complex64 con complex64 da complex64; cualquier mezcla con complex128 da complex128.
+    """
+    return max(precisiones, key=lambda p: _RANGO[p])
+
+
+def empaquetar(valores: Iterable[complex], precision: str) -> array:
+    """
+    Almacena una secuencia de complejos como un array plano [re0, im0, re1, im1, ...]
+    con la precisión indicada. En complex64 cada parte se redondea a float32.
+    """
+    datos = array(_CODIGOS_TIPO[precision])
+    for valor in valores:
+        valor = complex(valor)
+        datos.append(valor.real)
+        datos.append(valor.imag)
+    return datos
+
+
+def desempaquetar(datos: array) -> List[complex]:
+    """Reconstruye la lista de complejos a partir de un array plano empaquetado."""
+    return [complex(datos[i], datos[i + 1]) for i in range(0, len(datos), 2)]
+
+
+def a_pares(datos: array) -> List[List[float]]:
+    """Convierte un array plano empaquetado en pares [re, im] serializables en JSON."""
+    return [[datos[i], datos[i + 1]] for i in range(0, len(datos), 2)]
+
+
+def empaquetar_reales(valores: Iterable[float], precision: str) -> array:
+    """Almacena una secuencia de reales con la precisión dada (float32 para complex64)."""
+    return array(_CODIGOS_TIPO[precision], valores)
@@ -3,6 +3,7 @@ import os
 from typing import Dict, List, Optional, Union
 from src.estado_cuantico import EstadoCuantico
 from src.operador_cuantico import OperadorCuantico
+from src.precision import validar_precision, a_pares, PRECISION_POR_DEFECTO
 
 class RepositorioDeEstados:
     """
@@ -10,10 +11,18 @@ class RepositorioDeEstados:
 
     Almacena los estados en un diccionario, donde la clave es el identificador (id)
     y el valor es el objeto EstadoCuantico correspondiente.
+
+    La precisión del repositorio ("complex64" o "complex128") es la que reciben
+    los estados nuevos cuando no se indica otra de forma explícita.
     """
 
-    def __init__(self):
+    def __init__(self, precision: Optional[str] = None):
         self._estados: Dict[str, EstadoCuantico] = {}
+        self._precision = validar_precision(precision)
+
+    @property
+    def precision(self) -> str:
+        return self._precision
 
     def listar_estados(self) -> List[str]:
         """
@@ -26,7 +35,8 @@ class RepositorioDeEstados:
             return ["No hay estados cuánticos registrados."]
         return [str(estado) for estado in self._estados.values()]
 
-    def agregar_estado(self, id: str, vector: List[Union[float, complex]], base: str) -> bool:
+    def agregar_estado(self, id: str, vector: List[Union[float, complex]], base: str,
+                       precision: Optional[str] = None) -> bool:
         """
         Crea y añade un nuevo estado cuántico al repositorio.
 
@@ -34,6 +44,8 @@ class RepositorioDeEstados:
             id (str): Identificador único del estado.
             vector (List[Union[float, complex]]): Vector de amplitudes.
             base (str): Base asociada al estado.
+            precision (Optional[str]): Precisión del estado. Si es None, se usa
+                                       la precisión del repositorio.
 
         Retorna:
             bool: True si el estado fue agregado, False si el ID ya existe.
@@ -44,7 +56,8 @@ class RepositorioDeEstados:
         try:
             # Convertir el vector a List[complex] si contiene floats
             complex_vector = [complex(amp) for amp in vector]
-            nuevo_estado = EstadoCuantico(id, complex_vector, base)
+            nuevo_estado = EstadoCuantico(id, complex_vector, base,
+                                          precision if precision is not None else self._precision)
             self._estados[id] = nuevo_estado
             print(f"Estado '{id}' agregado exitosamente.")
             return True
@@ -141,11 +154,12 @@ class RepositorioDeEstados:
                 # O si estamos asumiendo solo floats, se puede dejar tal cual.
                 # Para simplificar y mantener la flexibilidad, convertimos a string.
                 # Una alternativa robusta sería una serialización personalizada con __json__ o similar.
-                serializable_vector = [[amp.real, amp.imag] for amp in estado.vector]
+                serializable_vector = a_pares(estado.datos)
 
                 list_of_states_data.append({
                     "id": estado.id,
                     "base": estado.base,
+                    "precision": estado.precision,
                     "vector": serializable_vector
                 })
 
@@ -177,16 +191,21 @@ class RepositorioDeEstados:
             with open(archivo, 'r', encoding='utf-8') as f:
                 list_of_states_data = json.load(f)
 
-            self._estados.clear() # Limpiar estados actuales antes de cargar
+            # Se construyen en un diccionario aparte para no perder los estados actuales
+            # si el archivo contiene datos inválidos
+            estados_cargados: Dict[str, EstadoCuantico] = {}
             for state_data in list_of_states_data:
                 id_ = state_data["id"]
                 base = state_data["base"]
+                # Los archivos anteriores a la precisión seleccionable se escribieron en doble precisión
+                precision = state_data.get("precision", PRECISION_POR_DEFECTO)
                 # Convertir el vector de nuevo a List[complex]
                 vector_raw = state_data["vector"]
                 vector = [complex(amp[0], amp[1]) for amp in vector_raw]
 
                 # Usamos el método interno para evitar mensajes de "ya existe" durante la carga masiva
-                self._estados[id_] = EstadoCuantico(id_, vector, base)
+                estados_cargados[id_] = EstadoCuantico(id_, vector, base, precision)
+            self._estados = estados_cargados
             print(f"Estados cargados exitosamente desde '{archivo}'. ({len(self._estados)} estados)")
             return True
         except json.JSONDecodeError as e:
@@ -195,6 +214,9 @@ class RepositorioDeEstados:
         except KeyError as e:
             print(f"Error: Datos faltantes en el archivo JSON (clave '{e}' no encontrada).")
             return False
+        except ValueError as e:
+            print(f"Error: Datos inválidos en el archivo JSON: {e}")
+            return False
         except Exception as e:
             print(f"Ocurrió un error inesperado al cargar: {e}")
             return False
\ No newline at end of file
@@ -69,6 +69,10 @@ class TestOperadorCuantico(unittest.TestCase):
         with self.assertRaises(ValueError):
             OperadorCuantico("Invalid", [[1, 2, 3], [4, 5, 6]])
 
+    def test_matriz_filas_irregulares_raises_error(self):
+        with self.assertRaises(ValueError):
+            OperadorCuantico("Invalid", [[0, 1], [1, 0, 5]])
+
     def test_aplicar_x_a_0(self):
         nuevo_estado = self.op_x.aplicar(self.estado_0)
         self.assertEqual(nuevo_estado.id, "q0_X")
@@ -193,7 +197,7 @@ class TestRepositorioDeEstados(unittest.TestCase):
         self.assertFalse(new_repo.cargar("non_existent_file.json"))
 
     def test_guardar_complejos_y_cargar(self):
-        complex_state_vector = [complex(0.6, 0.8), complex(0.8, -0.6)] # Not normalized, but for complex test
+        complex_state_vector = [complex(0.6, 0.8), complex(0.8, -0.6)] # Not normalized, se normaliza al agregarlo
         self.repo.agregar_estado("q_complex", complex_state_vector, "computacional")
         
         self.assertTrue(self.repo.guardar(self.temp_file))
@@ -203,11 +207,117 @@ class TestRepositorioDeEstados(unittest.TestCase):
         
         loaded_state = new_repo.obtener_estado("q_complex")
         self.assertIsNotNone(loaded_state)
+        # El vector se normaliza al agregarlo; se comparan las amplitudes almacenadas
+        expected = self.repo.obtener_estado("q_complex").vector
+        self.assertAlmostEqual(expected[0], complex(0.6, 0.8) / cmath.sqrt(2))
+        self.assertAlmostEqual(expected[1], complex(0.8, -0.6) / cmath.sqrt(2))
         # Check if real and imaginary parts are preserved
-        self.assertAlmostEqual(loaded_state.vector[0].real, complex(0.6, 0.8).real)
-        self.assertAlmostEqual(loaded_state.vector[0].imag, complex(0.6, 0.8).imag)
-        self.assertAlmostEqual(loaded_state.vector[1].real, complex(0.8, -0.6).real)
-        self.assertAlmostEqual(loaded_state.vector[1].imag, complex(0.8, -0.6).imag)
+        self.assertAlmostEqual(loaded_state.vector[0].real, expected[0].real)
+        self.assertAlmostEqual(loaded_state.vector[0].imag, expected[0].imag)
+        self.assertAlmostEqual(loaded_state.vector[1].real, expected[1].real)
+        self.assertAlmostEqual(loaded_state.vector[1].imag, expected[1].imag)
+
+
+class TestPrecision(unittest.TestCase):
+    def setUp(self):
+        self.temp_file = "test_estados_precision.json"
+        self.sqrt2_inv = 1 / cmath.sqrt(2)
+
+    def tearDown(self):
+        if os.path.exists(self.temp_file):
+            os.remove(self.temp_file)
+
+    def test_precision_por_defecto(self):
+        estado = EstadoCuantico("q0", [1, 0], "computacional")
+        op = OperadorCuantico("X", [[0, 1], [1, 0]])
+        self.assertEqual(estado.precision, "complex128")
+        self.assertEqual(op.precision, "complex128")
+        self.assertEqual(RepositorioDeEstados().precision, "complex128")
+
+    def test_precision_invalida_raises_error(self):
+        with self.assertRaises(ValueError):
+            EstadoCuantico("q0", [1, 0], "computacional", "complex32")
+        with self.assertRaises(ValueError):
+            OperadorCuantico("X", [[0, 1], [1, 0]], "float64")
+
+    def test_complex64_redondea_amplitudes(self):
+        estado = EstadoCuantico("q+", [1, 1], "computacional", "complex64")
+        self.assertEqual(estado.precision, "complex64")
+        self.assertNotEqual(estado.vector[0].real, float(self.sqrt2_inv.real))
+        self.assertAlmostEqual(estado.vector[0].real, self.sqrt2_inv.real, places=6)
+        probs = estado.medir()
+        self.assertAlmostEqual(probs['0'], 0.5, places=6)
+
+    def test_complex64_amplitud_mayor_que_float32(self):
+        estado = EstadoCuantico("q_big", [1e40, 1e40], "computacional", "complex64")
+        self.assertAlmostEqual(estado.vector[0].real, self.sqrt2_inv.real, places=6)
+        probs = estado.medir()
+        self.assertAlmostEqual(probs['0'], 0.5, places=6)
+        self.assertAlmostEqual(probs['1'], 0.5, places=6)
+
+    def test_complex64_amplitud_menor_que_float32(self):
+        estado = EstadoCuantico("q_small", [1e-46, 0], "computacional", "complex64")
+        self.assertEqual(estado.vector, [complex(1), complex(0)])
+        self.assertAlmostEqual(estado.medir()['0'], 1.0)
+
+    def test_vector_nan_no_inicial_raises_error(self):
+        for precision in ("complex64", "complex128"):
+            with self.assertRaises(ValueError):
+                EstadoCuantico("q_nan", [1, float('nan')], "computacional", precision)
+
+    def test_cargar_vector_nan(self):
+        with open(self.temp_file, 'w', encoding='utf-8') as f:
+            f.write('[{"id": "q0", "base": "computacional", "vector": [[1.0, 0.0], [NaN, 0.0]]}]')
+        repo = RepositorioDeEstados()
+        self.assertFalse(repo.cargar(self.temp_file))
+
+    def test_vector_norma_nula_raises_error(self):
+        with self.assertRaises(ValueError):
+            EstadoCuantico("q_zero", [0, 0], "computacional", "complex64")
+        repo = RepositorioDeEstados("complex64")
+        self.assertFalse(repo.agregar_estado("q_zero", [0, 0], "computacional"))
+
+    def test_promocion_al_aplicar(self):
+        estado_64 = EstadoCuantico("q0", [1, 0], "computacional", "complex64")
+        estado_128 = EstadoCuantico("q1", [1, 0], "computacional", "complex128")
+        op_h_64 = OperadorCuantico("H", [[self.sqrt2_inv, self.sqrt2_inv], [self.sqrt2_inv, -self.sqrt2_inv]], "complex64")
+        op_h_128 = OperadorCuantico("H", [[self.sqrt2_inv, self.sqrt2_inv], [self.sqrt2_inv, -self.sqrt2_inv]])
+        self.assertEqual(op_h_64.aplicar(estado_64).precision, "complex64")
+        self.assertEqual(op_h_64.aplicar(estado_128).precision, "complex128")
+        self.assertEqual(op_h_128.aplicar(estado_64).precision, "complex128")
+
+    def test_repositorio_complex64_guardar_cargar(self):
+        repo = RepositorioDeEstados("complex64")
+        repo.agregar_estado("q+", [1, 1], "computacional")
+        repo.agregar_estado("q0", [1, 0], "computacional", "complex128")
+        self.assertEqual(repo.obtener_estado("q+").precision, "complex64")
+        self.assertEqual(repo.obtener_estado("q0").precision, "complex128")
+        original = repo.obtener_estado("q+").vector
+        self.assertTrue(repo.guardar(self.temp_file))
+
+        new_repo = RepositorioDeEstados()
+        self.assertTrue(new_repo.cargar(self.temp_file))
+        loaded = new_repo.obtener_estado("q+")
+        self.assertEqual(loaded.precision, "complex64")
+        self.assertEqual(loaded.vector, original)
+        self.assertEqual(new_repo.obtener_estado("q0").precision, "complex128")
+
+    def test_cargar_archivo_sin_precision(self):
+        with open(self.temp_file, 'w', encoding='utf-8') as f:
+            json.dump([{"id": "q0", "base": "computacional", "vector": [[1.0, 0.0], [0.0, 0.0]]}], f)
+        repo = RepositorioDeEstados("complex64")
+        self.assertTrue(repo.cargar(self.temp_file))
+        self.assertEqual(repo.obtener_estado("q0").precision, "complex128")
+
+    def test_cargar_precision_invalida(self):
+        with open(self.temp_file, 'w', encoding='utf-8') as f:
+            json.dump([{"id": "q0", "base": "computacional", "precision": "complex32",
+                        "vector": [[1.0, 0.0], [0.0, 0.0]]}], f)
+        repo = RepositorioDeEstados()
+        repo.agregar_estado("q1", [0, 1], "computacional")
+        self.assertFalse(repo.cargar(self.temp_file))
+        # Los estados previos se conservan si el archivo es inválido
+        self.assertIsNotNone(repo.obtener_estado("q1"))
 
 
 if __name__ == '__main__':